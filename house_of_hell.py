@@ -1,83 +1,390 @@
-from dataclasses import dataclass, asdict
-import json, os
+from collections import deque
+from dataclasses import dataclass, field
+import json, os, re, sys
 from pathlib import Path
-import shutil
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple, Deque, Callable
 
-@dataclass
+try:
+  # optional fast JSON backend, stdlib json is used when missing
+  import orjson
+except ImportError:
+  orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+  """Encode `data` as single-line UTF-8 JSON"""
+  if orjson is not None:
+    return orjson.dumps(data)
+  return json.dumps(
+    data, ensure_ascii=False, separators=(",", ":")
+  ).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+  """Decode UTF-8 JSON bytes"""
+  if orjson is not None:
+    return orjson.loads(raw)
+  return json.loads(raw)
+
+
+# characters that force a JSON string through the escaping encoder
+_NEEDS_ESCAPE = re.compile(r'["\\\x00-\x1f]')
+_JSON_BOOL = {True: b"true", False: b"false"}
+
+
+def _encode_str(s: str) -> bytes:
+  """Encode a JSON string, skipping the escape pass for plain text"""
+  if _NEEDS_ESCAPE.search(s) is None:
+    return b'"' + s.encode("utf-8") + b'"'
+  return json.dumps(s, ensure_ascii=False).encode("utf-8")
+
+
+def _encode_node(node: "Node") -> bytes:
+  """Hand-rolled encoding of `node.to_dict()` for the stdlib fallback"""
+  children = b",".join(
+    _encode_str(text) + b":%d" % num for text, num in node.children.items()
+  )
+  return (
+    b'{"number":%d,"battle":%s,"death":%s,"complete":%s,'
+    b'"children":{%s},"children_visited":%d}' % (
+      node.number,
+      _JSON_BOOL[node.battle],
+      _JSON_BOOL[node.death],
+      _JSON_BOOL[node.complete],
+      children,
+      node.children_visited,
+    )
+  )
+
+
+# terminal colours
+_RESET = "\033[0m"
+_DEATH = "\033[30;41m"
+_BATTLE = "\033[30;43m"
+_INCOMPLETE = "\033[93m"
+_VISITED = "\033[94m"
+_COMPLETE = "\033[92m"
+_HIGHLIGHT = "\033[30;103m"
+
+# tree drawing
+_CONNECTOR_LAST = "└──"
+_CONNECTOR_MID = "├──"
+_INDENT_LAST = "    "
+_INDENT_MID = "│   "
+_CURRENT_MARKER = " ⬅ current"
+_TREE_TITLE = "╭══════════════════ 💀 HOUSE OF HELL TREE 💀 ══════════════════╮"
+_TREE_LEGEND = (
+  "│                                                              │",
+  "│ LEGEND:                                                      │",
+  "│ D: death │ B: battle │ V: visited │ I: incomplete │ L: loop  │",
+  "╰──────────────────────────────────────────────────────────────╯",
+)
+
+
+@dataclass(slots=True)
 class Node:
   """Represents a paragraph in a Fighting Fantasy book"""
   number: int
   battle: bool = False
   death: bool = False
   complete: bool = False
-  # choice_text -> paragraph_number
+  # choice_text -> paragraph_number, ordered by paragraph number
   children: Dict[str, int] = None
   # how many child nodes visited
   children_visited: int = 0
+  # how many choices lead to a complete paragraph, kept by the tracker
+  complete_children_count: int = field(
+    default=0, init=False, repr=False, compare=False
+  )
+  # set of target paragraphs, rebuilt lazily after a change
+  _child_dest_set: Optional[Set[int]] = field(
+    default=None, init=False, repr=False, compare=False
+  )
+  # encoded `to_dict()`, reused by saves until the node changes
+  _json_cache: Optional[bytes] = field(
+    default=None, init=False, repr=False, compare=False
+  )
+  # (emoji, label) shown by the tree view
+  _status_cache: Optional[Tuple[str, str]] = field(
+    default=None, init=False, repr=False, compare=False
+  )
   
   def __post_init__(self):
     if self.children is None:
       self.children = {}
 
+  def encoded(self) -> bytes:
+    """JSON encoding of `to_dict()`, cached until the node changes"""
+    if self._json_cache is None:
+      if orjson is not None:
+        self._json_cache = orjson.dumps(self.to_dict())
+      else:
+        self._json_cache = _encode_node(self)
+    return self._json_cache
+
+  @classmethod
+  def from_dict(cls, data:Dict[str, Any]) -> "Node":
+    """Build a node from saved data, interning the choice texts"""
+    # fill the known fields directly, skipping __init__/__post_init__
+    node = cls.__new__(cls)
+    node.number = data["number"]
+    # saves may hold null or 0/1 flags; totals and the encoder want bools
+    node.battle = bool(data.get("battle", False))
+    node.death = bool(data.get("death", False))
+    node.complete = bool(data.get("complete", False))
+    children = data.get("children") or {}
+    items = children.items()
+    dests = list(children.values())
+    if any(a > b for a, b in zip(dests, dests[1:])):
+      # saves from before children were kept in paragraph order
+      items = sorted(items, key=lambda kv: kv[1])
+    # the same few choice texts repeat across the whole book
+    node.children = {sys.intern(k): v for k, v in items}
+    node.children_visited = data.get("children_visited", 0)
+    node.complete_children_count = 0
+    # cache slots start empty
+    node.invalidate()
+    return node
+
+  def leads_to(self, number:int) -> bool:
+    """Whether any choice goes to paragraph `number`"""
+    if self._child_dest_set is None:
+      self._child_dest_set = set(self.children.values())
+    return number in self._child_dest_set
+
+  def status(self) -> Tuple[str, str]:
+    """Tree view (emoji, label), cached until the node changes"""
+    if self._status_cache is None:
+      if self.death:
+        self._status_cache = ("💀", "D")
+      elif self.battle:
+        self._status_cache = ("⚔️", "B")
+      elif self.children:
+        # read but has unexplored children
+        self._status_cache = ("📖", "V")
+      elif self.complete:
+        # leaf node, complete
+        self._status_cache = ("✅", "C")
+      else:
+        # incomplete stub
+        self._status_cache = ("⚠️", "I")
+    return self._status_cache
+
+  def invalidate(self) -> None:
+    """Drop cached views of this node after it was modified"""
+    self._child_dest_set = None
+    self._json_cache = None
+    self._status_cache = None
+
+  def to_dict(self) -> Dict[str, Any]:
+    """Plain dict for JSON output (no deep copy, unlike `asdict`)"""
+    return {
+      "number": self.number,
+      "battle": self.battle,
+      "death": self.death,
+      "complete": self.complete,
+      "children": self.children,
+      "children_visited": self.children_visited,
+    }
+
+
+# stands in for paragraphs that are referenced but not stored
+_INCOMPLETE_STUB = Node(number=-1, complete=False)
+
 
 class HouseOfHellTracker:
   """Tracks choices and builds decision tree for House of Hell"""
   
   FILENAME = "house-of-hell-tree.json"
+  # append-only log of node changes since the last full save
+  JOURNAL = "house-of-hell-tree.jsonl"
+  # how many navigation steps `undo` can reverse
+  HISTORY_LIMIT = 128
   
 
   def __init__(self):
     self.tree: Dict[int, Node] = {}
     self.current_path: List[int] = []
-    self.path_history: List[List[int]] = []
-    self.load_tree()
+    # paragraph -> index of its first occurrence in current_path
+    self._path_pos: Dict[int, int] = {}
+    # undo records: (length to cut current_path back to, paragraphs to
+    # re-append after cutting)
+    self.path_history: Deque[Tuple[int, List[int]]] = deque(
+      maxlen=self.HISTORY_LIMIT
+    )
+    # paragraph_number -> {(parent_number, choice_text)} leading to it
+    self.parents: Dict[int, Set[Tuple[int, str]]] = {}
+    # whether the save file is behind the in-memory state
+    self._dirty = False
+    # nodes changed (or deleted) since they were last written out
+    self._dirty_nodes: Set[int] = set()
+    # overview totals, kept in step with every node change
+    self._deaths = 0
+    self._battles = 0
+    self._incomplete = 0
+    # the save file is read on first use, not at startup
+    self._tree_loaded = False
+
+
+  def _ensure_loaded(self) -> None:
+    """Load the save file the first time the tree is needed"""
+    if not self._tree_loaded:
+      self.load_tree()
   
 
   def load_tree(self) -> None:
-    """Load existing decision tree and current path from file"""
-    if os.path.exists(self.FILENAME):
+    """Load existing decision tree and current path, then replay journal"""
+    self._tree_loaded = True
+    self._load_snapshot()
+    self.replay_journal()
+    # everything loaded is already on disk
+    self._dirty_nodes.clear()
+    self._deaths = self._battles = self._incomplete = 0
+    for node in self.tree.values():
+      node.complete_children_count = sum(
+        1 for n in node.children.values()
+        if n in self.tree and self.tree[n].complete
+      )
+      self._count_node(node, 1)
+    # truncate path to valid nodes only
+    self._set_path([n for n in self.current_path if n in self.tree])
+
+
+  def _load_snapshot(self) -> None:
+    """Read the full save file, if there is one"""
+    try:
+      with open(self.FILENAME, "rb") as f:
+        raw = f.read()
+    except FileNotFoundError:
+      return
+
+    try:
+      data = _loads(raw)
+
+      # load tree
+      if "tree" in data:
+        for num_str, node_data in data["tree"].items():
+          node = Node.from_dict(node_data)
+          self.tree[int(num_str)] = node
+          self._index_node(node)
+
+      # load current path
+      if "current_path" in data:
+        self.current_path = data["current_path"]
+      # restores full path
+      if "path_history" in data:
+        self.path_history = deque(maxlen=self.HISTORY_LIMIT)
+        for entry in data['path_history']:
+          if len(entry) == 2 and isinstance(entry[1], list):
+            self.path_history.append((entry[0], entry[1]))
+          elif entry:
+            # older saves kept whole paths: cut everything, re-append it
+            self.path_history.append((0, entry))
+    except (json.JSONDecodeError, KeyError, TypeError):
+      print("Corrupted save file. Starting fresh.")
+      self._dirty = True
+      self.tree = {}
+      self.parents = {}
+      self.current_path = []
+
+
+  def replay_journal(self) -> None:
+    """Apply node changes recorded after the last full save"""
+    try:
+      with open(self.JOURNAL, "rb") as f:
+        lines = f.readlines()
+    except FileNotFoundError:
+      return
+    # snapshot is stale until the journal is compacted into it
+    self._dirty = bool(lines) or self._dirty
+
+    # end of the last intact record, where the next append must start
+    good_end = 0
+    for line in lines:
       try:
-        with open(self.FILENAME, "r", encoding="utf-8") as f:
-          data = json.load(f)
-
-        # load tree
-        if "tree" in data:
-          for num_str, node_data in data["tree"].items():
-            node = Node(**node_data)
-            self.tree[int(num_str)] = node
-            num = int(num_str)
-            if num in self.tree:
-              self.tree[num].children_visited = node_data.get("children_visited", 0)
-
-        # load current path
-        if "current_path" in data:
-          self.current_path = data["current_path"]
-          # truncate path to valid nodes only
-          self.current_path = [n for n in self.current_path if n in self.tree]
-        # restores full path
-        if "path_history" in data:
-          self.path_history = [p for p in data['path_history'] if p]
-      except (json.JSONDecodeError, KeyError, TypeError):
-        print("Corrupted save file. Starting fresh.")
-        self.tree = {}
-        self.current_path = []
-
-
-  def save_tree(self) -> None:
-    """Save decision tree and current path to file atomically"""
-    data = {
-      "tree": {str(node.number): asdict(node) for node in self.tree.values()},
-      "current_path": self.current_path,
-      "path_history": [path for path in self.path_history]
-    }
-    # write to temp file first
+        record = _loads(line)
+        if record["op"] == "upsert":
+          node = Node.from_dict(record["node"])
+          if node.number in self.tree:
+            self._unindex_node(self.tree[node.number])
+          self.tree[node.number] = node
+          self._index_node(node)
+        elif record["op"] == "delete":
+          self._delete_node(record["number"])
+      except (ValueError, KeyError, TypeError, AttributeError):
+        # torn write from a crash, nothing after it can be trusted; cut it
+        # off so later appends don't land on the same broken line
+        print("Corrupted journal entry. Ignoring the rest of the journal.")
+        os.truncate(self.JOURNAL, good_end)
+        break
+      good_end += len(line)
+
+
+  def _touch(self, *numbers:int) -> None:
+    """Mark nodes as changed since the last save"""
+    self._dirty_nodes.update(numbers)
+    self._dirty = True
+
+
+  def _flush_journal(self) -> None:
+    """Append one record per node changed since the last save"""
+    if not self._dirty_nodes:
+      return
+    lines = []
+    for number in sorted(self._dirty_nodes):
+      node = self.tree.get(number)
+      if node is None:
+        lines.append(b'{"op":"delete","number":%d}\n' % number)
+      else:
+        # splice the cached node encoding instead of re-encoding a record
+        lines.append(b'{"op":"upsert","node":' + node.encoded() + b'}\n')
+    with open(self.JOURNAL, "a+b") as f:
+      # start on a fresh line if the last record lost its newline
+      end = f.seek(0, os.SEEK_END)
+      if end:
+        f.seek(end - 1)
+        if f.read(1) != b"\n":
+          lines.insert(0, b"\n")
+      f.write(b"".join(lines))
+    self._dirty_nodes.clear()
+
+
+  def save_tree(self, incremental:bool=False) -> None:
+    """Journal changed nodes, or rewrite the whole file and drop the journal"""
+    if incremental:
+      self._flush_journal()
+      return
+    if not self._dirty:
+      return
+
+    # write to temp file first, streaming one node per line from the
+    # per-node cache so only nodes changed since the last save are encoded
+    # again and the whole tree is never joined into one buffer
     temp_name = self.FILENAME + ".new"
-    with open(temp_name, 'w', encoding='utf-8') as f:
-      json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(temp_name, 'wb') as f:
+      f.write(b'{"tree": {')
+      sep = b"\n  "
+      for n in self.tree.values():
+        f.write(sep + b'"%d": ' % n.number + n.encoded())
+        sep = b",\n  "
+      f.write(b'\n},\n"current_path": ' + _dumps(self.current_path))
+      f.write(
+        b',\n"path_history": ' + _dumps(list(self.path_history)) + b"\n}\n"
+      )
+      # make sure the bytes hit the disk before the rename
+      f.flush()
+      os.fsync(f.fileno())
 
     # atomic rename/replace or create-if-missing
-    shutil.move(temp_name, self.FILENAME)
+    os.replace(temp_name, self.FILENAME)
+
+    # snapshot now holds every journaled change
+    try:
+      os.remove(self.JOURNAL)
+    except FileNotFoundError:
+      pass
+    self._dirty = False
+    self._dirty_nodes.clear()
   
 
   def add_or_update_node(
@@ -89,23 +396,108 @@ class HouseOfHellTracker:
     choices:Optional[Dict[str, int]]=None,
   ) -> None:
     """Add or update a node in the tree"""
-    node = self.tree.get(number, Node(number))
+    self._ensure_loaded()
+    node = self.tree.get(number)
+    if node is None:
+      node = Node(number)
+    else:
+      self._count_node(node, -1)
+    if node.complete != complete:
+      # keep the parents' completed-children counts in step
+      delta = 1 if complete else -1
+      for parent_num, _ in self.parents.get(number, ()):
+        self.tree[parent_num].complete_children_count += delta
     node.battle = battle
     node.death = death
     node.complete = complete
+    node.invalidate()
+    self._count_node(node, 1)
+    self._touch(number)
+    # in the tree before linking, so a choice looping back is counted
+    self.tree[number] = node
 
     if choices:
-      node.children.update(choices)
+      for choice_text, next_num in choices.items():
+        self._link(node, choice_text, next_num)
+      # re-sort once per edit so renders can walk children as stored
+      node.children = dict(sorted(node.children.items(), key=lambda kv: kv[1]))
       # ensure all target paragraphs exist as incomplete nodes
       for _, next_num in choices.items():
         if next_num not in self.tree:
-          self.tree[next_num] = Node(number=next_num, complete=False)
-
-    self.tree[number] = node
+          stub = Node(number=next_num, complete=False)
+          self.tree[next_num] = stub
+          self._count_node(stub, 1)
+          self._touch(next_num)
+
+
+  def _count_node(self, node:Node, sign:int) -> None:
+    """Add (sign=1) or remove (sign=-1) `node` from the overview totals"""
+    self._deaths += sign * node.death
+    self._battles += sign * node.battle
+    self._incomplete += sign * (not (node.complete or node.death))
+
+
+  def _delete_node(self, number:int) -> None:
+    """Remove a node and every choice leading to it"""
+    # drop references from its parents' children first, while the node is
+    # still there to update their completed-children counts
+    for parent_num, choice_text in self.parents.pop(number, ()):
+      self._unlink(self.tree[parent_num], choice_text)
+    node = self.tree.pop(number, None)
+    if node:
+      self._unindex_node(node)
+      self._count_node(node, -1)
+      self._touch(number)
+
+
+  def _link(self, node:Node, choice_text:str, next_num:int) -> None:
+    """Add or redirect a choice, keeping the parent index in sync"""
+    choice_text = sys.intern(choice_text)
+    if choice_text in node.children:
+      self._unlink(node, choice_text)
+    node.children[choice_text] = next_num
+    node.invalidate()
+    target = self.tree.get(next_num)
+    if target and target.complete:
+      node.complete_children_count += 1
+    self._touch(node.number)
+    self.parents.setdefault(next_num, set()).add((node.number, choice_text))
+
+
+  def _unlink(self, node:Node, choice_text:str) -> None:
+    """Remove a choice, keeping the parent index in sync"""
+    next_num = node.children.pop(choice_text)
+    node.invalidate()
+    target = self.tree.get(next_num)
+    if target and target.complete:
+      node.complete_children_count -= 1
+    self._touch(node.number)
+    refs = self.parents.get(next_num)
+    if refs:
+      refs.discard((node.number, choice_text))
+      if not refs:
+        del self.parents[next_num]
+
+
+  def _index_node(self, node:Node) -> None:
+    """Register all of `node`'s choices in the parent index"""
+    for choice_text, next_num in node.children.items():
+      self.parents.setdefault(next_num, set()).add((node.number, choice_text))
+
+
+  def _unindex_node(self, node:Node) -> None:
+    """Drop all of `node`'s choices from the parent index"""
+    for choice_text, next_num in node.children.items():
+      refs = self.parents.get(next_num)
+      if refs:
+        refs.discard((node.number, choice_text))
+        if not refs:
+          del self.parents[next_num]
   
 
   def go_to_paragraph(self, number: int) -> None:
     """Navigate to a paragraph and track the path"""
+    self._ensure_loaded()
     node = self.tree.get(number)
 
     # auto-edit if empty
@@ -121,77 +513,77 @@ class HouseOfHellTracker:
       print(f"New paragraph {number}. Please describe what happens here.")
       self.prompt_for_node(number)
 
-    old_path = self.current_path.copy()
-    was_in_old_path = number in old_path
+    old_length = len(self.current_path)
+    removed: List[int] = []
+    was_in_old_path = number in self._path_pos
 
     # navigate
     if number not in self.tree:
       print(f"First visit to ¶{number}")
-      self.current_path.append(number)
+      self._push_path(number)
+    elif was_in_old_path:
+      idx = self._path_pos[number]
+      if idx < old_length - 1:
+        removed = self._truncate_path(idx + 1)
+      else:
+        print(f"Revisiting ¶{number}")
+        self._push_path(number)
     else:
-      try:
-        idx = self.current_path.index(number)
-        if idx < len(self.current_path) - 1:
-          self.current_path = self.current_path[:idx + 1]
-        else:
-          print(f"Revisiting ¶{number}")
-          self.current_path.append(number)
-      except ValueError:
-        self.current_path.append(number)
+      self._push_path(number)
 
     # increment parent only on new/forward
     if not was_in_old_path and len(self.current_path) > 1:
       parent_num = self.current_path[-2]
       parent_node = self.tree[parent_num]
-      if number in parent_node.children.values():
+      if parent_node.leads_to(number):
         parent_node.children_visited = min(
           parent_node.children_visited + 1,
           len(parent_node.children)
         )
+        parent_node.invalidate()
+        self._touch(parent_num)
 
-    # save old path
-    self.path_history.append(old_path)
+    # remember how to reverse this step instead of copying the old path
+    self.path_history.append(
+      (min(old_length, len(self.current_path)), removed)
+    )
+    self._dirty = True
     self.display_status(number)
 
 
   def display_status(self, number: int) -> None:
     """Display current paragraph status with colour coding"""
+    self._ensure_loaded()
     node = self.tree[number]
+    complete_count = node.complete_children_count
     
-    # status print
+    # status line
     if node.death:
-      print(f"\033[30;41m¶{number:3d} 💀 DEATH\033[0m")
+      status = f"{_DEATH}¶{number:3d} 💀 DEATH{_RESET}"
     elif node.battle:
-      print(f"\033[30;43m¶{number:3d} ⚔️  BATTLE\033[0m")
+      status = f"{_BATTLE}¶{number:3d} ⚔️  BATTLE{_RESET}"
     elif not node.complete:
-      print(f"\033[93m¶{number:3d} ⚠️  INCOMPLETE\033[0m")
-    elif (
-      node.children and
-      sum(
-        1 for n in node.children.values() if self.tree.get(n, Node(n)).complete
-      ) < len(node.children)
-    ):
-      print(f"\033[94m¶{number:3d} 📖  VISITED\033[0m")
+      status = f"{_INCOMPLETE}¶{number:3d} ⚠️  INCOMPLETE{_RESET}"
+    elif node.children and complete_count < len(node.children):
+      status = f"{_VISITED}¶{number:3d} 📖  VISITED{_RESET}"
     else:
-      print(f"\033[92m¶{number:3d} ✅ COMPLETE\033[0m")
-    
-    visited_count = sum(
-      1 for child_num in node.children.values()
-      if child_num in self.tree and
-      self.tree[child_num].complete
-    )
-    print(f"  Children: {len(node.children)} ({visited_count} visited)")
-
-    if node.children:
-      for choice, next_num in sorted(node.children.items()):
-        # ensure a Node exists for each child; if missing, create incomplete one
-        marker_node = self.tree.get(next_num)
-        marker = "" if marker_node and marker_node.complete else "⚠️"
-        print(f"   → {choice:<20} ¶{next_num:3d} {marker}")
+      status = f"{_COMPLETE}¶{number:3d} ✅ COMPLETE{_RESET}"
+
+    # collect every line and write once at the end
+    lines = [
+      status,
+      f"  Children: {len(node.children)} ({complete_count} visited)",
+    ]
+    for choice, next_num in node.children.items():
+      marker_node = self.tree.get(next_num)
+      marker = "" if marker_node and marker_node.complete else "⚠️"
+      lines.append(f"   → {choice:<20} ¶{next_num:3d} {marker}")
+    sys.stdout.write("\n".join(lines) + "\n")
   
 
   def prompt_for_node(self, number:int) -> None:
     """Interactive prompt to fill and edit node information"""
+    self._ensure_loaded()
     existing = self.tree.get(number)
     print(f"\n--- Paragraph {number} ---")
 
@@ -248,7 +640,6 @@ class HouseOfHellTracker:
             self.add_or_update_node(number, battle=False, death=False, complete=False)
             break
         existing = self.tree[number]
-        self.save_tree()
         break
       elif action == "2":
         # add or overwrite choices for this node
@@ -282,7 +673,7 @@ class HouseOfHellTracker:
           idx = int(input("Delete which choice number? ")) - 1
           if 0 <= idx < len(choices_list):
             key_to_delete = choices_list[idx][0]
-            del existing.children[key_to_delete]
+            self._unlink(existing, key_to_delete)
             print("Choice deleted.")
         except ValueError:
           print("Invalid number.")
@@ -290,20 +681,16 @@ class HouseOfHellTracker:
         # delete all choices
         existing = self.tree.get(number)
         if existing:
-          existing.children.clear()
+          for choice_text in list(existing.children):
+            self._unlink(existing, choice_text)
           print("All choices deleted.")
       elif action == "5":
         # delete this node entirely
         confirm = input("Really delete this node? (y/N): ").strip().lower()
         if confirm == "y":
-          if number in self.tree:
-            del self.tree[number]
-          # also remove references to this node from other nodes' children
-          for node in self.tree.values():
-            to_delete = [c for c, dest in node.children.items() if dest == number]
-            for c in to_delete:
-              del node.children[c]
+          self._delete_node(number)
           print("Node deleted.")
+          self.save_tree(incremental=True)
           # leave editing
           return
       else:
@@ -321,18 +708,17 @@ class HouseOfHellTracker:
     else:
       print(f"Paragraph {number} left as stub (incomplete).")
 
-    self.save_tree()
+    self.save_tree(incremental=True)
   
 
   def show_tree_overview(self) -> None:
     """Show overview of explored tree"""
+    self._ensure_loaded()
     print("╭═══════════════ ⚔️ HOUSE OF HELL OVERVIEW ⚔️ ═══════════════╮")
     
-    deaths = sum(1 for node in self.tree.values() if node.death)
-    battles = sum(1 for node in self.tree.values() if node.battle)
-    incomplete = sum(
-      1 for node in self.tree.values() if not node.complete and not node.death
-    )
+    deaths = self._deaths
+    battles = self._battles
+    incomplete = self._incomplete
     
     print(f"│ Total Paragraphs: {len(self.tree):<40} │")
     print(
@@ -344,7 +730,7 @@ class HouseOfHellTracker:
     if self.current_path:
       current = self.current_path[-1]
       highlighted_path = ' → '.join(
-        f"\033[30;103m{n}\033[0m" if n == current else str(n)
+        f"{_HIGHLIGHT}{n}{_RESET}" if n == current else str(n)
         for n in self.current_path
       )
       print("\nCurrent path:", highlighted_path)
@@ -354,8 +740,11 @@ class HouseOfHellTracker:
 
   def backtrack(self) -> None:
     """Go back one paragraph in path"""
+    self._ensure_loaded()
     if self.current_path:
-      self.current_path.pop()
+      removed = self._truncate_path(len(self.current_path) - 1)
+      self.path_history.append((len(self.current_path), removed))
+      self._dirty = True
       if self.current_path:
         print(f"Back to ¶{self.current_path[-1]}")
         self.display_status(self.current_path[-1])
@@ -365,104 +754,185 @@ class HouseOfHellTracker:
       print("Already at start.")
 
 
+  def _set_path(self, path:List[int]) -> None:
+    """Replace current_path and rebuild its position map"""
+    self.current_path = path
+    self._path_pos = {}
+    for idx, n in enumerate(path):
+      self._path_pos.setdefault(n, idx)
+
+
+  def _push_path(self, number:int) -> None:
+    """Append to current_path, keeping the first position of repeats"""
+    self._path_pos.setdefault(number, len(self.current_path))
+    self.current_path.append(number)
+
+
+  def _truncate_path(self, length:int) -> List[int]:
+    """Cut current_path down to `length` entries, returning the cut tail"""
+    removed = self.current_path[length:]
+    for n in removed:
+      if self._path_pos.get(n, -1) >= length:
+        del self._path_pos[n]
+    del self.current_path[length:]
+    return removed
+
+
+  def undo(self) -> None:
+    """Reverse the last navigation step (go or back)"""
+    self._ensure_loaded()
+    if not self.path_history:
+      print("Nothing to undo.")
+      return
+    length, tail = self.path_history.pop()
+    self._truncate_path(length)
+    for n in tail:
+      self._push_path(n)
+    self._dirty = True
+    print(f"Back to path: {' → '.join(map(str, self.current_path))}")
+    if self.current_path:
+      self.display_status(self.current_path[-1])
+
+
   def print_tree(self, root:int=1) -> None:
     """Print a 2D ASCII tree of all explored paths from `root`"""
+    self._ensure_loaded()
     if root not in self.tree:
       print(f"Root paragraph {root} is not in the tree yet.")
       return
 
-    print("╭══════════════════ 💀 HOUSE OF HELL TREE 💀 ══════════════════╮")
-    print(f"│ Current paragraph: {self.current_path[-1]:<41} │")
-    print(f"│                                                              │")
-    print(f"│ LEGEND:                                                      │")
-    print(f"│ D: death │ B: battle │ V: visited │ I: incomplete │ L: loop  │")
-    print("╰──────────────────────────────────────────────────────────────╯")
+    # collect every line and write once at the end
+    lines = [
+      _TREE_TITLE,
+      f"│ Current paragraph: {self.current_path[-1]:<41} │",
+      *_TREE_LEGEND,
+    ]
 
     # track printed nodes
     visited = set()
 
-    # fast lookup for current path highlighting
-    current_set = set(self.current_path)
-
-    def status_emoji(node:Node) -> str:
-      if node.death:
-        return "💀"
-      if node.battle:
-        return "⚔️"
-      if node.children:
-        # read but has unexplored children
-        return "📖"
-      if node.children_visited == len(node.children) and node.children:
-        # all children nodes explored
-        return "✅"
-      if node.complete:
-        # leaf node, complete
-        return "✅"
-      # incomplete stub
-      return "⚠️"
-
-    def status_label(node:Node) -> str:
-      if node.death:
-        return "D"
-      if node.battle:
-        return "B"
-      if node.children:
-        return "V" # visited (unexplored children nodes)
-      if node.children_visited == len(node.children) and node.children:
-        return "F" # all children nodes explored
-      if node.complete:
-        return "C" # complete leaf
-      return "I" # incomplete
+    current = self.current_path[-1]
 
     def marker(node_num:int) -> str:
       # highlight current path node
-      return " ⬅ current" if node_num == self.current_path[-1] else ""
-    
-    def dfs(node_num:int, prefix:str="", is_last:bool=True) -> None:
+      return _CURRENT_MARKER if node_num == current else ""
+
+    # (node_num, prefix, is_last); children are pushed in reverse so they
+    # pop in sorted order
+    stack: List[Tuple[int, str, bool]] = []
+
+    def push_children(node:Node, prefix:str) -> None:
+      targets = list(node.children.values())
+      last = len(targets) - 1
+      for idx in range(last, -1, -1):
+        stack.append((targets[idx], prefix, idx == last))
+
+    # root printed without prefix
+    root_node = self.tree[root]
+    emoji, label = root_node.status()
+    lines.append(f"[{root}] {emoji} ({label}) {marker(root)}")
+    push_children(root_node, "")
+
+    while stack:
+      node_num, prefix, is_last = stack.pop()
+      connector = _CONNECTOR_LAST if is_last else _CONNECTOR_MID
       if node_num in visited:
         # skip cycles
-        print(f"{prefix}{'└──' if is_last else '├──'} [⭕ {node_num}] (L)")
-        return
+        lines.append(f"{prefix}{connector} [⭕ {node_num}] (L)")
+        continue
       visited.add(node_num)
 
-      node = self.tree.get(node_num)
-      if node is None:
-        # create implicit incomplete node if it is referenced but not stored
-        node = Node(number=node_num, complete=False)
-        self.tree[node_num] = node
-
-      connector = "└──" if is_last else "├──"
-      emoji = status_emoji(node)
-      label = status_label(node)
-      print(f"{prefix}{connector} [{node_num}] {emoji} ({label}){marker(node_num)}")
+      # render a referenced but unstored paragraph as incomplete
+      node = self.tree.get(node_num, _INCOMPLETE_STUB)
 
-      children_items = sorted(node.children.items(), key=lambda kv: kv[1])
-      if not children_items:
-        return
+      emoji, label = node.status()
+      lines.append(
+        f"{prefix}{connector} [{node_num}] {emoji} ({label}){marker(node_num)}"
+      )
 
       # next prefix for children
-      child_prefix = prefix + ("    " if is_last else "│   ")
+      push_children(node, prefix + (_INDENT_LAST if is_last else _INDENT_MID))
 
-      for idx, (_, child_num) in enumerate(children_items):
-        last_child = (idx == len(children_items) - 1)
-        dfs(child_num, child_prefix, last_child)
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
-    # root printed without prefix
-    root_node = self.tree.get(root)
-    if root_node is None:
-      root_node = Node(number=root, complete=False)
-      self.tree[root] = root_node
 
-    print(
-      f"[{root}] {status_emoji(root_node)} ({status_label(root_node)}) {marker(root)}"
-    )
-    children_items = sorted(root_node.children.items(), key=lambda kv: kv[1])
+_USAGE = (
+  "Commands: go <number>, overview, tree [root], back, "
+  "edit <number>, undo, quit"
+)
+
+
+def _cmd_quit(tracker:HouseOfHellTracker, args:List[str]) -> bool:
+  """quit: save and end the session"""
+  tracker.save_tree()
+  print("╭═════════════════════ SESSION SAVED ════════════════════════╮")
+  print("│    💀  Beware... The house remembers your paths...  💀     │")
+  print("╰────────────────────────────────────────────────────────────╯")
+  return True
+
+
+def _cmd_go(tracker:HouseOfHellTracker, args:List[str]) -> None:
+  """go <number>: navigate to a paragraph"""
+  if len(args) != 1:
+    print(_USAGE)
+    return
+  try:
+    num = int(args[0])
+    tracker.go_to_paragraph(num)
+  except ValueError:
+    print("Please enter: go <paragraph_number>")
+
+
+def _cmd_overview(tracker:HouseOfHellTracker, args:List[str]) -> None:
+  """overview: show tree statistics"""
+  tracker.show_tree_overview()
+
+
+def _cmd_tree(tracker:HouseOfHellTracker, args:List[str]) -> None:
+  """tree [root]: print the tree, from paragraph 1 by default"""
+  if len(args) == 1:
+    try:
+      root = int(args[0])
+      tracker.print_tree(root=root)
+    except ValueError:
+      print("Please enter: tree <paragraph number>")
+  else:
+    # default root = 1
+    tracker.print_tree()
+
+
+def _cmd_back(tracker:HouseOfHellTracker, args:List[str]) -> None:
+  """back: go back one paragraph"""
+  tracker.backtrack()
+
+
+def _cmd_edit(tracker:HouseOfHellTracker, args:List[str]) -> None:
+  """edit <number>: edit a paragraph"""
+  if len(args) != 1:
+    print(_USAGE)
+    return
+  try:
+    num = int(args[0])
+    tracker.prompt_for_node(num)
+  except ValueError:
+    print("Please enter: edit <paragraph number>")
 
-    for idx, (_, child_num) in enumerate(children_items):
-      last_child = (idx == len(children_items) - 1)
-      dfs(child_num, "", last_child)
 
-    print()
+def _cmd_undo(tracker:HouseOfHellTracker, args:List[str]) -> None:
+  """undo: restore the previous path"""
+  tracker.undo()
+
+
+# command -> handler(tracker, args); a truthy return ends the session
+HANDLERS: Dict[str, Callable[[HouseOfHellTracker, List[str]], Optional[bool]]] = {
+  "quit": _cmd_quit,
+  "go": _cmd_go,
+  "overview": _cmd_overview,
+  "tree": _cmd_tree,
+  "back": _cmd_back,
+  "edit": _cmd_edit,
+  "undo": _cmd_undo,
+}
 
 
 def main() -> None:
@@ -484,57 +954,18 @@ def main() -> None:
     ╰═══════════════════════════════════════════════════════════════╯
   """
   print(mansion_banner)
-  print(
-    "\nCommands: go <number>, overview, tree [root], back, "
-    "edit <number>, undo, quit"
-  )
+  print("\n" + _USAGE)
   
   while True:
     cmd = input("\n> ").strip().lower().split()
     if not cmd:
       continue
-    
-    if cmd[0].lower() == "quit":
-      tracker.save_tree()
-      print("╭═════════════════════ SESSION SAVED ════════════════════════╮")
-      print("│    💀  Beware... The house remembers your paths...  💀     │")
-      print("╰────────────────────────────────────────────────────────────╯")
+
+    handler = HANDLERS.get(cmd[0])
+    if handler is None:
+      print(_USAGE)
+    elif handler(tracker, cmd[1:]):
       break
-    elif cmd[0].lower() == "go" and len(cmd) == 2:
-      try:
-        num = int(cmd[1])
-        tracker.go_to_paragraph(num)
-      except ValueError:
-        print("Please enter: go <paragraph_number>")
-    elif cmd[0].lower() == "overview":
-      tracker.show_tree_overview()
-    elif cmd[0].lower() == "tree":
-      if len(cmd) == 2:
-        try:
-          root = int(cmd[1])
-          tracker.print_tree(root=root)
-        except ValueError:
-          print("Please enter: tree <paragraph number>")
-      else:
-        # default root = 1
-        tracker.print_tree()
-    elif cmd[0].lower() == "back":
-      tracker.backtrack()
-    elif cmd[0].lower() == "edit" and len(cmd) == 2:
-      try:
-        num = int(cmd[1])
-        tracker.prompt_for_node(num)
-      except ValueError:
-        print("Please enter: edit <paragraph number>")
-    elif cmd[0].lower() == "undo" and self.path_history:
-      self.current_path = self.path_history.pop()
-      print(f"Back to path: {' → '.join(map(str, self.current_path))}")
-      self.display_status(self.current_path[-1])
-    else:
-      print(
-        "Commands: go <number>, overview, tree [root], back, "
-        "edit <number>, undo, quit"
-      )
 
 if __name__ == "__main__":
   main()